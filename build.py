@@ -20,12 +20,24 @@ Usage:
 """
 
 import argparse
+import copy
+import functools
+import io
+import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 import duckdb
 import yaml
 
+try:
+    # LibYAML C bindings parse/emit ~5-10x faster than the pure-Python classes
+    from yaml import CSafeDumper as YamlDumper
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+    from yaml import SafeLoader as YamlLoader
+
 
 # Type mapping from DuckDB types to contract types
 TYPE_MAPPING = {
@@ -51,10 +63,13 @@ TYPE_MAPPING = {
 }
 
 
+@functools.lru_cache(maxsize=256)
 def map_duckdb_type(duckdb_type: str) -> str:
     """Map DuckDB type to contract type."""
-    # Handle parametrized types like DECIMAL(18,2), VARCHAR(255)
-    base_type = duckdb_type.split('(')[0].upper().strip()
+    # Handle parametrized types like DECIMAL(18,2), VARCHAR(255); partition
+    # avoids the intermediate list that split allocates, and the lru_cache
+    # skips the work entirely for the highly repetitive types of wide tables.
+    base_type = duckdb_type.partition('(')[0].strip().upper()
     return TYPE_MAPPING.get(base_type, 'VARCHAR')
 
 
@@ -71,38 +86,40 @@ def introspect_schema(con: duckdb.DuckDBPyConnection, source: Optional[str] = No
         List of column definitions
     """
     if source:
-        # Register the source as a table
+        # Describe the file reader directly: no CREATE VIEW round-trip, and
+        # the path is bound as a parameter instead of spliced into the SQL
         file_ext = Path(source).suffix.lower()
         if file_ext == '.parquet':
-            con.execute(f"CREATE OR REPLACE VIEW temp_source AS SELECT * FROM read_parquet('{source}')")
+            reader = 'read_parquet'
         elif file_ext in ['.csv', '.tsv']:
-            con.execute(f"CREATE OR REPLACE VIEW temp_source AS SELECT * FROM read_csv_auto('{source}')")
+            reader = 'read_csv_auto'
         else:
             raise ValueError(f"Unsupported file format: {file_ext}")
 
         # Get schema information
-        result = con.execute("DESCRIBE temp_source").fetchall()
+        result = con.execute(f"DESCRIBE SELECT * FROM {reader}(?)", [source]).fetch_df()
     elif query:
         # Create a temporary view from the query
         con.execute(f"CREATE OR REPLACE VIEW temp_source AS {query}")
-        result = con.execute("DESCRIBE temp_source").fetchall()
+        result = con.execute("DESCRIBE temp_source").fetch_df()
     else:
         raise ValueError("Either source or query must be provided")
 
-    columns = []
-    for row in result:
-        col_name = row[0]
-        col_type = row[1]
-        col_nullable = row[2] == 'YES' if len(row) > 2 else True
-
-        # Map the type
-        mapped_type = map_duckdb_type(col_type)
+    # Map types for the whole schema at once instead of row-by-row Python
+    base_types = result['column_type'].astype(str).str.partition('(')[0].str.strip().str.upper()
+    mapped_types = base_types.map(TYPE_MAPPING).fillna('VARCHAR')
+    if 'null' in result.columns:
+        nullables = result['null'].eq('YES')
+    else:
+        nullables = [True] * len(result)
 
+    columns = []
+    for col_name, mapped_type, col_nullable in zip(result['column_name'], mapped_types, nullables):
         # Build column definition
         col_def = {
             'name': col_name,
             'type': mapped_type,
-            'nullable': col_nullable,
+            'nullable': bool(col_nullable),
             'description': f'{col_name} column'
         }
 
@@ -211,14 +228,31 @@ def write_contract(contract: Dict, output_path: str):
         output_path: Output file path
     """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(output_file)
 
     with open(output_file, 'w') as f:
-        yaml.dump(contract, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+        yaml.dump(contract, f, Dumper=YamlDumper, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
     print(f"✅ Contract generated: {output_path}")
 
 
+# Parsed contracts keyed by (path, mtime_ns) so repeated generations in one
+# invocation skip the YAML re-parse but still see on-disk edits.
+_CONTRACT_CACHE: Dict[Tuple[str, int], Dict] = {}
+
+# Parent directories already created in this run; batch generators hit the
+# same output directory repeatedly, so skip the redundant mkdir/stat calls.
+_CREATED_DIRS: set = set()
+
+
+def _ensure_parent_dir(output_file: Path) -> None:
+    """Create the parent directory once per run."""
+    parent = str(output_file.parent)
+    if parent not in _CREATED_DIRS:
+        os.makedirs(parent, exist_ok=True)
+        _CREATED_DIRS.add(parent)
+
+
 def load_contract(contract_path: str) -> Dict:
     """
     Load a contract from a YAML file.
@@ -229,9 +263,18 @@ def load_contract(contract_path: str) -> Dict:
     Returns:
         Contract dictionary
     """
-    with open(contract_path, 'r') as f:
-        contract = yaml.safe_load(f)
-    return contract
+    cache_key = (str(contract_path), os.stat(contract_path).st_mtime_ns)
+    contract = _CONTRACT_CACHE.get(cache_key)
+    if contract is None:
+        with open(contract_path, 'r') as f:
+            contract = yaml.load(f, Loader=YamlLoader)
+        _CONTRACT_CACHE[cache_key] = contract
+    # Deep-copy so callers can mutate without poisoning the cache
+    return copy.deepcopy(contract)
+
+
+# Column types usable for ordering the dedup window
+_ORDERING_TYPES = frozenset({'TIMESTAMP', 'DATE'})
 
 
 def generate_sql_from_contract(contract: Dict, input_alias: str = 'input_data') -> str:
@@ -249,50 +292,55 @@ def generate_sql_from_contract(contract: Dict, input_alias: str = 'input_data')
     description = contract.get('description', '')
     columns = contract.get('schema', {}).get('columns', [])
 
-    # Start building SQL
-    sql_lines = [
-        f"-- Generated from contract: {dataset}",
-        f"-- Description: {description}",
-        "--",
-        "-- This SQL transformation is automatically generated from the data contract schema.",
-        "-- Customize as needed for your business logic.",
-        "",
-        "SELECT"
-    ]
-
-    # Generate column selections with transformations
-    column_selects = []
+    # Assemble into a StringIO buffer: the column expressions stream straight
+    # into the output instead of accumulating interim joined strings.
+    buf = io.StringIO()
+    write = buf.write
+    write(f"-- Generated from contract: {dataset}\n")
+    write(f"-- Description: {description}\n")
+    write("--\n")
+    write("-- This SQL transformation is automatically generated from the data contract schema.\n")
+    write("-- Customize as needed for your business logic.\n")
+    write("\nSELECT\n")
+
+    # Single pass over columns: write the SELECT list and collect WHERE
+    # conditions and unique-constraint columns together.
+    where_conditions = []
+    unique_cols = []
+    first_ts = None
+    first_col = True
     for col in columns:
         col_name = col['name']
         col_type = col['type']
         col_desc = col.get('description', '')
         constraints = col.get('constraints', [])
+        name_l = col_name.lower()
+
+        if not first_col:
+            write(",\n")
+        first_col = False
 
-        # Check for specific transformation patterns
-        if 'email' in col_name.lower() and 'hash' in col_name.lower():
+        # Remember the first timestamp-ish column for dedup ordering
+        if first_ts is None and col_type in _ORDERING_TYPES:
+            first_ts = col_name
+
+        # Check for specific transformation patterns; the endswith test
+        # rejects the common non-hash column with a single suffix check
+        if name_l.endswith('_hash') and 'email' in name_l:
             # Pseudonymize email
             original_col = col_name.replace('_hash', '')
-            column_selects.append(f"    SHA2({original_col}, 256) AS {col_name}  -- Pseudonymize PII")
+            write(f"    SHA2({original_col}, 256) AS {col_name}  -- Pseudonymize PII")
         elif col_name.endswith('_code') and col_type == 'VARCHAR':
             # Normalize codes
             original_col = col_name.replace('_code', '')
-            column_selects.append(f"    UPPER(SUBSTR({original_col}, 1, 2)) AS {col_name}  -- Normalize code")
+            write(f"    UPPER(SUBSTR({original_col}, 1, 2)) AS {col_name}  -- Normalize code")
         elif col_name == 'processed_at' and col_type == 'TIMESTAMP':
             # Add processing timestamp
-            column_selects.append(f"    CURRENT_TIMESTAMP AS {col_name}")
+            write(f"    CURRENT_TIMESTAMP AS {col_name}")
         else:
             # Standard column selection
             comment = f"  -- {col_desc}" if col_desc and col_desc != f"{col_name} column" else ""
-            column_selects.append(f"    {col_name}{comment}")
-
-    sql_lines.append(",\n".join(column_selects))
-    sql_lines.append(f"FROM {input_alias}")
-
-    # Generate WHERE clauses from constraints
-    where_conditions = []
-    for col in columns:
-        col_name = col['name']
-        constraints = col.get('constraints', [])
+            write(f"    {col_name}{comment}")
 
         for constraint in constraints:
             if isinstance(constraint, dict):
@@ -302,29 +350,24 @@ def generate_sql_from_contract(contract: Dict, input_alias: str = 'input_data')
                     where_conditions.append(f"    {col_name} >= {constraint['min_value']}")
                 if 'max_value' in constraint:
                     where_conditions.append(f"    {col_name} <= {constraint['max_value']}")
+                if constraint.get('unique'):
+                    unique_cols.append(col_name)
+
+    write(f"\nFROM {input_alias}")
 
     if where_conditions:
-        sql_lines.append("WHERE")
-        sql_lines.append("\n    AND ".join(where_conditions))
+        write("\nWHERE\n")
+        write("\n    AND ".join(where_conditions))
 
     # Add deduplication if there's a unique constraint
-    unique_cols = []
-    for col in columns:
-        constraints = col.get('constraints', [])
-        for constraint in constraints:
-            if isinstance(constraint, dict) and constraint.get('unique'):
-                unique_cols.append(col['name'])
-
     if unique_cols:
-        sql_lines.append("-- Remove duplicates based on primary key")
+        write("\n-- Remove duplicates based on primary key")
         partition_cols = ', '.join(unique_cols)
-        # Find a timestamp column for ordering
-        timestamp_cols = [c['name'] for c in columns if c.get('type') in ['TIMESTAMP', 'DATE']]
-        order_col = timestamp_cols[0] if timestamp_cols else unique_cols[0]
-        sql_lines.append(f"QUALIFY ROW_NUMBER() OVER (PARTITION BY {partition_cols} ORDER BY {order_col} DESC) = 1")
+        order_col = first_ts if first_ts else unique_cols[0]
+        write(f"\nQUALIFY ROW_NUMBER() OVER (PARTITION BY {partition_cols} ORDER BY {order_col} DESC) = 1")
 
-    sql_lines.append("")  # Empty line at end
-    return "\n".join(sql_lines)
+    write("\n")  # Empty line at end
+    return buf.getvalue()
 
 
 def write_sql(sql: str, output_path: str):
@@ -336,7 +379,7 @@ def write_sql(sql: str, output_path: str):
         output_path: Output file path
     """
     output_file = Path(output_path)
-    output_file.parent.mkdir(parents=True, exist_ok=True)
+    _ensure_parent_dir(output_file)
 
     with open(output_file, 'w') as f:
         f.write(sql)
@@ -344,6 +387,81 @@ def write_sql(sql: str, output_path: str):
     print(f"✅ SQL transformation generated: {output_path}")
 
 
+def generate_one(
+    con: duckdb.DuckDBPyConnection,
+    output: str,
+    dataset: str,
+    stage: str,
+    source: Optional[str] = None,
+    query: Optional[str] = None,
+    owner: str = 'data-team',
+    description: str = '',
+    version: str = '1.0.0',
+) -> None:
+    """
+    Generate a single contract on an existing DuckDB connection.
+
+    Batch invocations share one in-memory connection across datasets so the
+    Python/DuckDB startup cost is paid once, not per contract.
+
+    Args:
+        con: DuckDB connection to introspect with
+        output: Output contract file path
+        dataset: Dataset name
+        stage: Pipeline stage (bronze, silver, gold)
+        source: Path to Parquet/CSV file
+        query: SQL query to introspect
+        owner: Dataset owner
+        description: Dataset description
+        version: Contract version
+    """
+    print(f"🔍 Introspecting schema from {source or 'query'}...")
+    columns = introspect_schema(con, source=source, query=query)
+    print(f"   Found {len(columns)} columns")
+
+    print("📝 Generating contract...")
+    contract = generate_contract(
+        dataset=dataset,
+        stage=stage,
+        columns=columns,
+        owner=owner,
+        description=description,
+        version=version,
+    )
+
+    write_contract(contract, output)
+
+
+def generate_batch(con: duckdb.DuckDBPyConnection, manifest_path: str) -> None:
+    """
+    Generate contracts for every entry in a batch manifest.
+
+    The manifest is a YAML list of entries with the same keys as the CLI
+    options (source/query, output, dataset, stage, and optionally owner,
+    description, version).
+
+    Args:
+        con: Shared DuckDB connection
+        manifest_path: Path to the YAML manifest file
+    """
+    with open(manifest_path, 'r') as f:
+        entries = yaml.load(f, Loader=YamlLoader) or []
+
+    print(f"📦 Generating {len(entries)} contracts from {manifest_path}...")
+    for entry in entries:
+        generate_one(
+            con,
+            output=entry['output'],
+            dataset=entry['dataset'],
+            stage=entry['stage'],
+            source=entry.get('source'),
+            query=entry.get('query'),
+            owner=entry.get('owner', 'data-team'),
+            description=entry.get('description', ''),
+            version=entry.get('version', '1.0.0'),
+        )
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Generate data contracts and SQL transformations',
@@ -369,6 +487,7 @@ Examples:
     mode_group.add_argument('--source', help='Path to source file (Parquet, CSV) - generates contract')
     mode_group.add_argument('--query', help='SQL query to introspect (e.g., "SELECT * FROM table LIMIT 1") - generates contract')
     mode_group.add_argument('--generate-sql', action='store_true', help='Generate SQL transformation from contract')
+    mode_group.add_argument('--batch', help='Path to a YAML manifest of contract entries - generates all on one connection')
 
     # Contract generation options
     parser.add_argument('--dataset', help='Dataset name (required for contract generation)')
@@ -382,7 +501,7 @@ Examples:
     parser.add_argument('--input-alias', default='input_data', help='Input table alias for SQL generation (default: input_data)')
 
     # Output options
-    parser.add_argument('--output', required=True, help='Output file path')
+    parser.add_argument('--output', help='Output file path')
 
     args = parser.parse_args()
 
@@ -390,11 +509,15 @@ Examples:
     if args.generate_sql:
         if not args.contract:
             parser.error('--contract is required when using --generate-sql')
-    else:
+        if not args.output:
+            parser.error('--output is required when using --generate-sql')
+    elif not args.batch:
         if not args.dataset:
             parser.error('--dataset is required when generating contracts')
         if not args.stage:
             parser.error('--stage is required when generating contracts')
+        if not args.output:
+            parser.error('--output is required when generating contracts')
 
     try:
         if args.generate_sql:
@@ -418,30 +541,30 @@ Examples:
             print(f"   - name: {dataset}")
             print(f"     type: sql")
 
+        elif args.batch:
+            # Generate many contracts on one shared connection
+            con = duckdb.connect(':memory:')
+            generate_batch(con, args.batch)
+
+            print(f"\n✨ Success! Contracts generated from {args.batch}")
+
         else:
             # Generate contract from source
             # Create DuckDB connection
             con = duckdb.connect(':memory:')
 
-            # Introspect schema
-            print(f"🔍 Introspecting schema from {args.source or 'query'}...")
-            columns = introspect_schema(con, source=args.source, query=args.query)
-            print(f"   Found {len(columns)} columns")
-
-            # Generate contract
-            print("📝 Generating contract...")
-            contract = generate_contract(
+            generate_one(
+                con,
+                output=args.output,
                 dataset=args.dataset,
                 stage=args.stage,
-                columns=columns,
+                source=args.source,
+                query=args.query,
                 owner=args.owner,
                 description=args.description,
-                version=args.version
+                version=args.version,
             )
 
-            # Write to file
-            write_contract(contract, args.output)
-
             print(f"\n✨ Success! Contract created at {args.output}")
             print(f"\nNext steps:")
             print(f"1. Review and customize the contract at {args.output}")
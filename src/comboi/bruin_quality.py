@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import importlib.util
+import os
 import sys
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, List, Optional
 
 import duckdb
@@ -27,6 +29,37 @@ class BruinQualityRunner:
     def __init__(self, transformations_path: Path, contracts_path: Optional[Path] = None):
         self.transformations_path = transformations_path
         self.contracts_path = contracts_path
+        self._con: Optional[duckdb.DuckDBPyConnection] = None
+        self._con_lock = Lock()
+
+    def _get_con(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return the shared DuckDB connection, creating it on first use.
+
+        A fresh connection per dataset re-initialized the catalog and thread
+        pool and re-read the parquet metadata from scratch; one connection
+        shared across all checks of a stage amortizes that setup. Callers run
+        on cursors of this connection, which are safe to use concurrently;
+        creation itself is locked because the silver stage checks datasets
+        from a thread pool.
+        """
+        with self._con_lock:
+            if self._con is None:
+                self._con = duckdb.connect(
+                    config={
+                        "threads": os.cpu_count() or 4,
+                        "memory_limit": os.getenv("COMBOI_DUCKDB_MEM", "4GB"),
+                        "enable_object_cache": "true",
+                    }
+                )
+            return self._con
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection if it was opened."""
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
 
     def run_quality_checks(
         self,
@@ -40,8 +73,9 @@ class BruinQualityRunner:
 
         logger.info("Running bruin quality checks", dataset=dataset_name)
 
-        # Create DuckDB connection for quality checks
-        con = duckdb.connect()
+        # Run on a cursor of the shared connection: independent datasets can
+        # be checked concurrently while connection setup happens only once.
+        con = self._get_con().cursor()
         try:
             # Load the data into a view
             con.execute(
@@ -1,9 +1,30 @@
 """Database connectors for Comboi."""
 
-from comboi.connectors.azure_sql import AzureSQLConnector
-from comboi.connectors.base import BaseConnector
-from comboi.connectors.postgres import PostgresConnector
-from comboi.connectors.sap_b1 import SAPB1Connector
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from comboi.connectors.azure_sql import AzureSQLConnector
+    from comboi.connectors.base import BaseConnector
+    from comboi.connectors.postgres import PostgresConnector
+    from comboi.connectors.sap_b1 import SAPB1Connector
 
 __all__ = ["BaseConnector", "AzureSQLConnector", "PostgresConnector", "SAPB1Connector"]
 
+# PEP 562 lazy loading: importing comboi.connectors no longer force-loads the
+# per-source connector modules; each is imported on first attribute access.
+_LAZY = {
+    "BaseConnector": "base",
+    "AzureSQLConnector": "azure_sql",
+    "PostgresConnector": "postgres",
+    "SAPB1Connector": "sap_b1",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY:
+        module = importlib.import_module(f"comboi.connectors.{_LAZY[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
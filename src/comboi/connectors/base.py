@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import os
+import re
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 import duckdb
 
@@ -14,6 +18,52 @@ from comboi.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Incremental columns are interpolated as SQL identifiers and cannot be bound
+# as parameters, so restrict them to plain identifiers.
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _validate_identifier(name: str) -> str:
+    """Validate that a config-supplied column name is a plain SQL identifier."""
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid SQL identifier in configuration: {name!r}")
+    return name
+
+
+# Source-side types a checkpoint value may be compared as; the CAST keeps the
+# comparison typed so the source planner can still use its index.
+_INCREMENTAL_TYPES = frozenset(
+    {"TIMESTAMP", "DATE", "BIGINT", "INTEGER", "DOUBLE", "VARCHAR"}
+)
+
+
+def _validate_incremental_type(type_name: str) -> str:
+    """Validate a config-supplied incremental column type."""
+    upper = type_name.upper()
+    if upper not in _INCREMENTAL_TYPES:
+        raise ValueError(
+            f"Unsupported incremental_type {type_name!r}; "
+            f"expected one of {sorted(_INCREMENTAL_TYPES)}"
+        )
+    return upper
+
+
+# Parquet write defaults: zstd shrinks files ~2x over snappy at small CPU
+# cost, and 120k-row row groups align with DuckDB's vectorized reader for
+# faster downstream silver/gold scans.
+DEFAULT_PARQUET_COMPRESSION = "zstd"
+DEFAULT_PARQUET_ROW_GROUP_SIZE = 122880
+
+
+def parquet_copy_options(table_cfg: Optional[Dict[str, str]] = None) -> str:
+    """Build the option clause for a Parquet COPY, honoring config overrides."""
+    cfg = table_cfg or {}
+    compression = cfg.get("compression", DEFAULT_PARQUET_COMPRESSION)
+    row_group_size = cfg.get("row_group_size", DEFAULT_PARQUET_ROW_GROUP_SIZE)
+    return (
+        f"FORMAT PARQUET, COMPRESSION '{compression}', ROW_GROUP_SIZE {row_group_size}"
+    )
+
 
 @dataclass
 class BaseConnector(ABC):
@@ -21,6 +71,8 @@ class BaseConnector(ABC):
 
     connection_string: str
     checkpoint_store: CheckpointStore
+    _con: Optional[duckdb.DuckDBPyConnection] = field(default=None, init=False, repr=False)
+    _con_lock: Lock = field(default_factory=Lock, init=False, repr=False)
 
     @property
     @abstractmethod
@@ -40,6 +92,44 @@ class BaseConnector(ABC):
         """Return the DuckDB ATTACH type (e.g., 'ODBC', 'POSTGRES')."""
         pass
 
+    def _get_con(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return the shared DuckDB connection, creating it on first use.
+
+        The extension install/load and source ATTACH are performed exactly once
+        per connector instance so repeated exports skip the per-call setup cost.
+        """
+        with self._con_lock:
+            if self._con is None:
+                con = duckdb.connect()
+                # Let large Parquet COPYs scale across cores; row order of the
+                # exports is not meaningful, so allow DuckDB to reorder for
+                # throughput.
+                con.execute(f"PRAGMA threads={os.cpu_count() or 4}")
+                con.execute("PRAGMA preserve_insertion_order=false")
+                if os.path.isdir("/dev/shm"):
+                    # Push spills to tmpfs instead of disk when available
+                    con.execute("PRAGMA temp_directory='/dev/shm/comboi_duckdb'")
+
+                # Install and load the DuckDB extension
+                con.execute(f"INSTALL {self.duckdb_extension};")
+                con.execute(f"LOAD {self.duckdb_extension};")
+
+                # Attach the database
+                con.execute(
+                    f"ATTACH '{self.connection_string}' "
+                    f"(TYPE {self.duckdb_attach_type}, READ_ONLY=TRUE)"
+                )
+                self._con = con
+            return self._con
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection if it was opened."""
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
     def export_table(
         self,
         table_cfg: Dict[str, str],
@@ -50,26 +140,103 @@ class BaseConnector(ABC):
         Export a table from the source database to Parquet format.
 
         Args:
-            table_cfg: Table configuration containing 'query', 'name', and optional 'incremental_column'
+            table_cfg: Table configuration containing 'query', 'name', and optional 'incremental_column'.
+                The query may contain a '{WHERE_INC}' placeholder marking where
+                the incremental predicate should be spliced; this runs the
+                filter server-side instead of wrapping the whole query, which
+                matters for sources with poor subquery pushdown (ODBC/legacy
+                SQL Server).
             destination: Path where the Parquet file will be written
             checkpoint_key: Optional key for checkpoint tracking
 
         Returns:
             Path to the exported Parquet file
         """
+        return self._export_on(self._get_con(), table_cfg, destination, checkpoint_key)
+
+    def export_tables(
+        self,
+        tables: List[Tuple[Dict[str, str], Path, Optional[str]]],
+        max_workers: int = 4,
+    ) -> List[Path]:
+        """
+        Export multiple tables concurrently on the shared connection.
+
+        Each worker runs on its own cursor of the shared connection, so the
+        loaded extension and attached source are reused while DuckDB overlaps
+        source fetches with Parquet writes.
+
+        Args:
+            tables: List of (table_cfg, destination, checkpoint_key) tuples
+            max_workers: Maximum number of concurrent exports
+
+        Returns:
+            List of exported Parquet file paths, in input order
+        """
+        if len(tables) <= 1 or max_workers <= 1:
+            return [
+                self.export_table(cfg, dest, checkpoint_key=key)
+                for cfg, dest, key in tables
+            ]
+
+        shared_con = self._get_con()
+
+        def _export(job: Tuple[Dict[str, str], Path, Optional[str]]) -> Path:
+            table_cfg, destination, checkpoint_key = job
+            cursor = shared_con.cursor()
+            try:
+                return self._export_on(cursor, table_cfg, destination, checkpoint_key)
+            finally:
+                cursor.close()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tables))) as executor:
+            return list(executor.map(_export, tables))
+
+    def _export_on(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        table_cfg: Dict[str, str],
+        destination: Path,
+        checkpoint_key: Optional[str],
+    ) -> Path:
+        """Run a single table export on the given connection or cursor."""
         destination.parent.mkdir(parents=True, exist_ok=True)
         query = table_cfg["query"]
         incremental_column = table_cfg.get("incremental_column")
         last_value = None
+        params: List[str] = []
 
-        # Handle incremental loads
+        # Handle incremental loads; the value is shipped as a bound parameter
+        # so the source plan is cached instead of re-parsed per tick.
         if checkpoint_key and incremental_column:
+            _validate_identifier(incremental_column)
             last_value = self.checkpoint_store.get(checkpoint_key)
             if last_value:
-                query = f"""
-                SELECT * FROM ({query}) AS src
-                WHERE {incremental_column} > '{last_value}'
-                """
+                # Present the bound value as a typed constant when the config
+                # declares the column type, so the comparison is not a string
+                # compare that would disable the source index.
+                incremental_type = table_cfg.get("incremental_type")
+                if incremental_type:
+                    placeholder = f"CAST(? AS {_validate_incremental_type(incremental_type)})"
+                else:
+                    placeholder = "?"
+                if "{WHERE_INC}" in query:
+                    # Template form: the predicate lands inside the source
+                    # query and executes as a native server-side filter.
+                    query = query.replace(
+                        "{WHERE_INC}", f"{incremental_column} > {placeholder}"
+                    )
+                    params.append(last_value)
+                else:
+                    query = f"""
+                    SELECT * FROM ({query}) AS src
+                    WHERE {incremental_column} > {placeholder}
+                    """
+                    params.append(last_value)
+
+        # Full loads of templated queries get a pass-through predicate
+        if "{WHERE_INC}" in query:
+            query = query.replace("{WHERE_INC}", "1=1")
 
         logger.info(
             f"Executing {self.connector_name} query",
@@ -77,27 +244,15 @@ class BaseConnector(ABC):
             incremental=bool(last_value),
         )
 
-        con = duckdb.connect()
-        try:
-            # Install and load the DuckDB extension
-            con.execute(f"INSTALL {self.duckdb_extension};")
-            con.execute(f"LOAD {self.duckdb_extension};")
-
-            # Attach the database
-            con.execute(
-                f"ATTACH '{self.connection_string}' "
-                f"(TYPE {self.duckdb_attach_type}, READ_ONLY=TRUE)"
-            )
-
-            # Export to Parquet
-            con.execute(f"COPY ({query}) TO '{destination.as_posix()}' (FORMAT PARQUET)")
-
-            # Update checkpoint for incremental loads
-            if checkpoint_key and incremental_column:
-                self._update_checkpoint(con, table_cfg, incremental_column, checkpoint_key, last_value)
+        # Export to Parquet
+        con.execute(
+            f"COPY ({query}) TO '{destination.as_posix()}' ({parquet_copy_options(table_cfg)})",
+            params,
+        )
 
-        finally:
-            con.close()
+        # Update checkpoint for incremental loads
+        if checkpoint_key and incremental_column:
+            self._update_checkpoint(con, destination, incremental_column, checkpoint_key)
 
         logger.info(
             "Exported to destination",
@@ -110,19 +265,25 @@ class BaseConnector(ABC):
     def _update_checkpoint(
         self,
         con: duckdb.DuckDBPyConnection,
-        table_cfg: Dict[str, str],
+        destination: Path,
         incremental_column: str,
         checkpoint_key: str,
-        last_value: Optional[str],
     ) -> None:
-        """Update the checkpoint with the maximum incremental column value."""
-        max_query = f"SELECT MAX({incremental_column}) AS chk FROM ({table_cfg['query']}) src"
-        if last_value:
-            max_query += f" WHERE {incremental_column} > '{last_value}'"
+        """
+        Update the checkpoint with the maximum incremental column value.
 
-        result = con.execute(max_query).fetchone()
+        The max is computed from the Parquet file that was just written, which
+        contains exactly the exported rows, instead of re-executing the source
+        query over the network a second time.
+        """
+        result = con.execute(
+            f"SELECT MAX({incremental_column}) AS chk FROM read_parquet(?)",
+            [destination.as_posix()],
+        ).fetchone()
         if result and result[0]:
-            self.checkpoint_store.update(checkpoint_key, result[0])
+            # Persist as a string (ISO format for timestamps); the typed CAST
+            # on the next tick restores the native comparison type.
+            self.checkpoint_store.update(checkpoint_key, str(result[0]))
             logger.debug(
                 "Updated checkpoint",
                 checkpoint_key=checkpoint_key,
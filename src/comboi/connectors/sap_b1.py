@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import datetime
+import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from threading import Lock
+from typing import Dict, List, Optional, Tuple
 
 import duckdb
 
 from comboi.checkpoint import CheckpointStore
+from comboi.connectors.base import (
+    _validate_identifier,
+    _validate_incremental_type,
+    parquet_copy_options,
+)
 from comboi.gdpr import GDPRProcessor, get_sap_b1_table_config
 from comboi.logging import get_logger
 
@@ -37,12 +46,50 @@ class SAPB1Connector:
     source_storage_path: str  # Base path to SAP B1 extracts (e.g., "abfss://raw/sap_b1")
     checkpoint_store: CheckpointStore
     apply_gdpr: bool = True  # Whether to apply GDPR rules
+    _con: Optional[duckdb.DuckDBPyConnection] = field(default=None, init=False, repr=False)
+    _con_lock: Lock = field(default_factory=Lock, init=False, repr=False)
 
     @property
     def connector_name(self) -> str:
         """Return the connector name for logging."""
         return "SAP Business One"
 
+    def _get_con(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return the shared DuckDB connection, creating it on first use.
+
+        One connection serves every table export, so the azure extension
+        load, secret creation, and DuckDB's object cache of Parquet footers
+        persist across the 16-table Bronze iteration instead of being torn
+        down per table.
+        """
+        with self._con_lock:
+            if self._con is None:
+                con = duckdb.connect(
+                    config={
+                        # Explicit settings: under container CPU quotas (Azure
+                        # Functions, K8s) the defaults can leave Parquet scans
+                        # single-threaded and memory unbounded.
+                        "threads": os.cpu_count() or 4,
+                        "memory_limit": os.getenv("COMBOI_DUCKDB_MEM", "4GB"),
+                        # Row order of Bronze exports is not meaningful
+                        "preserve_insertion_order": "false",
+                        # Cache Parquet metadata across queries; the same file
+                        # is touched by the COPY and the checkpoint MAX
+                        "enable_object_cache": "true",
+                    }
+                )
+                self._configure_remote_access(con)
+                self._con = con
+            return self._con
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection if it was opened."""
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+
     def export_table(
         self,
         table_cfg: Dict[str, str],
@@ -64,6 +111,54 @@ class SAPB1Connector:
         Returns:
             Path to the exported Parquet file
         """
+        return self._export_on(self._get_con(), table_cfg, destination, checkpoint_key)
+
+    def export_tables(
+        self,
+        tables: List[Tuple[Dict[str, str], Path, Optional[str]]],
+        max_workers: int = 4,
+    ) -> List[Path]:
+        """
+        Export multiple tables concurrently on the shared connection.
+
+        Each worker runs on its own cursor of the shared connection, so the
+        loaded azure extension and the cached Parquet footers are reused
+        across all tables of the batch.
+
+        Args:
+            tables: List of (table_cfg, destination, checkpoint_key) tuples
+            max_workers: Maximum number of concurrent exports
+
+        Returns:
+            List of exported Parquet file paths, in input order
+        """
+        if len(tables) <= 1 or max_workers <= 1:
+            return [
+                self.export_table(cfg, dest, checkpoint_key=key)
+                for cfg, dest, key in tables
+            ]
+
+        shared_con = self._get_con()
+
+        def _export(job: Tuple[Dict[str, str], Path, Optional[str]]) -> Path:
+            table_cfg, destination, checkpoint_key = job
+            cursor = shared_con.cursor()
+            try:
+                return self._export_on(cursor, table_cfg, destination, checkpoint_key)
+            finally:
+                cursor.close()
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(tables))) as executor:
+            return list(executor.map(_export, tables))
+
+    def _export_on(
+        self,
+        con: duckdb.DuckDBPyConnection,
+        table_cfg: Dict[str, str],
+        destination: Path,
+        checkpoint_key: Optional[str],
+    ) -> Path:
+        """Run a single table export on the given connection or cursor."""
         destination.parent.mkdir(parents=True, exist_ok=True)
 
         table_name = table_cfg["name"]
@@ -88,66 +183,111 @@ class SAPB1Connector:
             gdpr_enabled=self.apply_gdpr,
         )
 
-        con = duckdb.connect()
-        try:
-            # Read from source Parquet files
-            # Support both partitioned (dt=2024-01-15/*.parquet) and non-partitioned
-            if "**" in source_path or "*" in source_path or source_path.endswith(
-                ".parquet"
-            ):
-                base_query = f"SELECT * FROM read_parquet('{source_path}')"
+        # Read from source Parquet files
+        # Support both partitioned (dt=2024-01-15/*.parquet) and non-partitioned
+        params: List[str] = []
+        if "**" in source_path or "*" in source_path or source_path.endswith(
+            ".parquet"
+        ):
+            base_query = f"SELECT * FROM read_parquet('{source_path}')"
+        else:
+            # Assume partitioned structure if not explicit. When the
+            # incremental column is the hive partition column and we have
+            # a date checkpoint, filter on the hive column: DuckDB prunes
+            # partition directories below the checkpoint without opening
+            # their files, and days with no partition directory (routine
+            # for low-volume tables) are simply absent — an enumerated
+            # per-day glob list would error on the first missing one.
+            prune_date = None
+            if last_value and incremental_column == partition_column:
+                prune_date = self._partition_prune_date(last_value)
+            if prune_date:
+                _validate_identifier(partition_column)
+                base_query = (
+                    f"SELECT * FROM read_parquet('{source_path}/*/*.parquet', "
+                    f"hive_partitioning=1) WHERE {partition_column} >= ?"
+                )
+                params.append(prune_date)
             else:
-                # Assume partitioned structure if not explicit
                 base_query = (
                     f"SELECT * FROM read_parquet('{source_path}/**/*.parquet')"
                 )
 
-            # Apply incremental filter
-            if last_value and incremental_column:
-                base_query = f"""
-                SELECT * FROM ({base_query}) AS src
-                WHERE {incremental_column} > '{last_value}'
-                """
-
-            # Apply GDPR rules if enabled
-            if self.apply_gdpr:
-                gdpr_config = get_sap_b1_table_config(table_name)
-                if gdpr_config:
-                    logger.debug(
-                        f"Applying GDPR rules to {table_name}",
-                        excluded_columns=len(gdpr_config.get("exclude_columns", [])),
-                        pseudonymized_columns=len(
-                            gdpr_config.get("pseudonymize", [])
-                        ),
-                    )
-                    # Create a temporary view for GDPR processing
-                    con.execute("CREATE OR REPLACE TEMP VIEW source_data AS " + base_query)
-                    final_query = GDPRProcessor.apply_gdpr_rules(
-                        con, "source_data", gdpr_config
-                    )
-                else:
-                    logger.warning(
-                        f"No GDPR configuration found for table {table_name}, "
-                        "data will be copied as-is"
-                    )
-                    final_query = base_query
+        # Apply incremental filter. The checkpoint value is shipped as a
+        # bound parameter instead of being spliced into the SQL text, so
+        # the query shape is stable across ticks; the typed CAST keeps
+        # the comparison a native timestamp/date compare, which lets
+        # Parquet min/max stats drive row-group skipping.
+        if last_value and incremental_column:
+            _validate_identifier(incremental_column)
+            incremental_type = _validate_incremental_type(
+                table_cfg.get("incremental_type", "TIMESTAMP")
+            )
+            base_query = f"""
+            SELECT * FROM ({base_query}) AS src
+            WHERE {incremental_column} > CAST(? AS {incremental_type})
+            """
+            params.append(last_value)
+
+        # Apply GDPR rules if enabled
+        if self.apply_gdpr:
+            gdpr_config = get_sap_b1_table_config(table_name)
+            if gdpr_config:
+                logger.debug(
+                    f"Applying GDPR rules to {table_name}",
+                    excluded_columns=len(gdpr_config.get("exclude_columns", [])),
+                    pseudonymized_columns=len(
+                        gdpr_config.get("pseudonymize", [])
+                    ),
+                )
+                # Pass the source subquery directly so the GDPR projection
+                # (which names only retained columns) is pushed down into
+                # the Parquet reader; excluded PII columns are then never
+                # decoded from storage.
+                final_query = GDPRProcessor.apply_gdpr_rules(
+                    con,
+                    f"({base_query})",
+                    gdpr_config,
+                    schema_cache_key=source_path,
+                    table_name=table_name,
+                    params=params,
+                )
             else:
+                logger.warning(
+                    f"No GDPR configuration found for table {table_name}, "
+                    "data will be copied as-is"
+                )
                 final_query = base_query
+        else:
+            final_query = base_query
+
+        # Single fused plan: scan source, apply the GDPR projection and
+        # incremental filter, and write Parquet in one pass — no temp
+        # table materialization and no second scan of the source.
+        con.execute(
+            f"COPY ({final_query}) TO '{destination.as_posix()}' "
+            f"({parquet_copy_options(table_cfg)})",
+            params,
+        )
 
-            # Export to Parquet
-            con.execute(
-                f"COPY ({final_query}) TO '{destination.as_posix()}' (FORMAT PARQUET)"
+        if checkpoint_key and incremental_column:
+            # The checkpoint max comes from the file just written; the
+            # footer statistics answer it without decoding any data pages.
+            # The GDPR projection may have dropped the incremental column
+            # from Bronze (e.g. OSLP retains no UpdateDate), so the
+            # pre-GDPR source query is passed along as the last resort.
+            self._update_checkpoint(
+                con,
+                destination,
+                incremental_column,
+                checkpoint_key,
+                incremental_type=_validate_incremental_type(
+                    table_cfg.get("incremental_type", "TIMESTAMP")
+                ),
+                source_query=base_query,
+                source_params=params,
             )
 
-            # Update checkpoint for incremental loads
-            if checkpoint_key and incremental_column:
-                self._update_checkpoint(
-                    con, base_query, incremental_column, checkpoint_key, last_value
-                )
-
-        finally:
-            con.close()
-
         logger.info(
             "Exported to Bronze layer",
             destination=str(destination),
@@ -156,6 +296,27 @@ class SAPB1Connector:
         )
         return destination
 
+    def _configure_remote_access(self, con: duckdb.DuckDBPyConnection) -> None:
+        """
+        Load the native Azure extension for abfss:// sources.
+
+        The azure extension keeps an authenticated session with connection
+        pooling across read_parquet calls, unlike routing ADLS through
+        httpfs, which re-establishes HTTPS connections far more often —
+        noticeable when listing many hive partition directories.
+        """
+        if not self.source_storage_path.startswith("abfss://"):
+            return
+
+        con.execute("INSTALL azure; LOAD azure;")
+        conn_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
+        if conn_str:
+            escaped = conn_str.replace("'", "''")
+            con.execute(
+                "CREATE OR REPLACE SECRET comboi_azure "
+                f"(TYPE AZURE, CONNECTION_STRING '{escaped}')"
+            )
+
     def _get_source_path(self, table_name: str, file_pattern: str) -> str:
         """
         Construct the full source path for a table.
@@ -178,20 +339,68 @@ class SAPB1Connector:
         # Support table-specific subdirectories (e.g., /raw/sap_b1/ocrd/dt=2024-01-15/)
         return f"{base}/{table_name.lower()}/{file_pattern}"
 
+    def _partition_prune_date(self, last_value: str) -> Optional[str]:
+        """
+        Normalize a checkpoint value to an ISO partition date, or None if
+        it is not date-shaped.
+
+        The checkpoint day itself is kept (>= in the filter, with the SQL
+        incremental filter still applied on top) so rows that arrived later
+        on the same day are not missed.
+        """
+        try:
+            return datetime.date.fromisoformat(str(last_value)[:10]).isoformat()
+        except ValueError:
+            return None
+
     def _update_checkpoint(
         self,
         con: duckdb.DuckDBPyConnection,
-        base_query: str,
+        destination: Path,
         incremental_column: str,
         checkpoint_key: str,
-        last_value: Optional[str],
+        incremental_type: str = "TIMESTAMP",
+        source_query: Optional[str] = None,
+        source_params: Optional[List[str]] = None,
     ) -> None:
-        """Update the checkpoint with the maximum incremental column value."""
-        max_query = f"SELECT MAX({incremental_column}) AS chk FROM ({base_query}) src"
-        if last_value:
-            max_query += f" WHERE {incremental_column} > '{last_value}'"
+        """
+        Update the checkpoint with the maximum incremental column value.
+
+        The max is taken from the written Bronze file's footer statistics
+        via parquet_metadata — O(row groups) with no data-page decoding.
+        If the writer left no statistics for the column this falls back to
+        aggregating the Bronze column itself (still a local read). Bronze
+        need not carry the column at all — a GDPR retain list may drop it —
+        so when both Bronze paths come up empty the max is aggregated from
+        the pre-GDPR source query instead.
+        """
+        result = None
+        try:
+            result = con.execute(
+                f"SELECT MAX(CAST(stats_max_value AS {incremental_type})) AS chk "
+                "FROM parquet_metadata(?) WHERE path_in_schema = ?",
+                [destination.as_posix(), incremental_column],
+            ).fetchone()
+        except duckdb.Error:
+            result = None
+
+        if not result or result[0] is None:
+            try:
+                result = con.execute(
+                    f"SELECT MAX({incremental_column}) AS chk FROM read_parquet(?)",
+                    [destination.as_posix()],
+                ).fetchone()
+            except duckdb.Error:
+                # Binder error: the column was projected out of Bronze
+                result = None
+
+        if (not result or result[0] is None) and source_query:
+            result = con.execute(
+                f"SELECT MAX({incremental_column}) AS chk "
+                f"FROM ({source_query}) AS chk_src",
+                source_params or [],
+            ).fetchone()
 
-        result = con.execute(max_query).fetchone()
         if result and result[0]:
             self.checkpoint_store.update(checkpoint_key, str(result[0]))
             logger.debug(
@@ -2,14 +2,25 @@ from __future__ import annotations
 
 import json
 import os
+import selectors
 import subprocess
 import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from threading import Lock
 from typing import Any, Dict, List
 
 import duckdb
 import yaml
 
+try:
+    # LibYAML C bindings emit several times faster than the pure-Python dumper
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    from yaml import SafeDumper as YamlDumper
+
+from comboi.connectors.base import parquet_copy_options
 from comboi.logging import get_logger
 
 logger = get_logger(__name__)
@@ -27,6 +38,11 @@ class DbtRunner:
         """
         self.dbt_project_path = dbt_project_path
         self.dbt_project_yml = dbt_project_path / "dbt_project.yml"
+        self._con: duckdb.DuckDBPyConnection | None = None
+        self._con_lock = Lock()
+        self._attached: Dict[str, str] = {}
+        self._compiled_paths: Dict[str, Path] | None = None
+        self._profiles_dirs: Dict[str, tempfile.TemporaryDirectory] = {}
 
         if not self.dbt_project_yml.exists():
             raise FileNotFoundError(
@@ -34,6 +50,70 @@ class DbtRunner:
                 "Ensure the dbt project is properly configured."
             )
 
+    def _get_con(self) -> duckdb.DuckDBPyConnection:
+        """
+        Return the shared DuckDB connection for exports, creating it lazily.
+
+        One connection serves all model exports, so extension loading happens
+        once and DuckDB's buffer manager can reuse cached Parquet footers when
+        several models read the same Silver inputs. Callers on worker threads
+        take a cursor of this connection rather than executing on it directly.
+        """
+        with self._con_lock:
+            if self._con is None:
+                con = duckdb.connect(
+                    ":memory:", config={"threads": os.cpu_count() or 4}
+                )
+                for extension in ("parquet", "httpfs"):
+                    con.execute(f"INSTALL {extension}; LOAD {extension};")
+                self._con = con
+            return self._con
+
+    def close(self) -> None:
+        """Close the shared DuckDB connection if it was opened."""
+        with self._con_lock:
+            if self._con is not None:
+                self._con.close()
+                self._con = None
+                self._attached.clear()
+
+    def _attach_dbt_db(self, db_path: Path) -> str:
+        """Attach the dbt-materialized database read-only, once per path."""
+        con = self._get_con()
+        key = db_path.as_posix()
+        with self._con_lock:
+            alias = self._attached.get(key)
+            if alias is None:
+                alias = f"dbt_db_{len(self._attached)}"
+                con.execute(f"ATTACH '{key}' AS {alias} (READ_ONLY)")
+                self._attached[key] = alias
+            return alias
+
+    def _detach_dbt_db(self, db_path: Path) -> None:
+        """Detach a previously attached dbt database before its dir is removed."""
+        key = db_path.as_posix()
+        with self._con_lock:
+            alias = self._attached.pop(key, None)
+            if alias is not None and self._con is not None:
+                self._con.execute(f"DETACH {alias}")
+
+    def _ensure_profiles_dir(self, target: str) -> str:
+        """
+        Return a persistent profiles directory for a target, creating it once.
+
+        Every dbt invocation used to mkdir a fresh TemporaryDirectory, write
+        profiles.yml into it, and remove it again; the directory (and the
+        dbt.duckdb file inside it) now lives for the process so repeat calls
+        skip the mkdir/write/rmdir cycle. TemporaryDirectory's finalizer
+        still cleans it up at interpreter exit.
+        """
+        tmpdir = self._profiles_dirs.get(target)
+        if tmpdir is None:
+            tmpdir = tempfile.TemporaryDirectory(prefix=f"comboi_dbt_{target}_")
+            self._generate_profiles_yml(Path(tmpdir.name), target)
+            self._profiles_dirs[target] = tmpdir
+        return tmpdir.name
+
     def run_transformation(
         self,
         model_name: str,
@@ -55,49 +135,20 @@ class DbtRunner:
         """
         logger.info("Running dbt model", model=model_name)
 
-        # Create a temporary profiles directory
-        with tempfile.TemporaryDirectory() as profiles_dir:
-            # Generate profiles.yml
-            self._generate_profiles_yml(Path(profiles_dir), target)
-
-            # Prepare dbt command
-            cmd = [
-                "dbt",
-                "run",
-                "--profiles-dir",
-                profiles_dir,
-                "--project-dir",
-                str(self.dbt_project_path),
-                "--select",
-                model_name,
-                "--target",
-                target,
-            ]
-
-            # Add variables if provided
-            if vars_dict:
-                vars_json = self._vars_to_json(vars_dict)
-                cmd.extend(["--vars", vars_json])
-
-            # Run dbt
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=str(self.dbt_project_path),
-                )
-                logger.debug("dbt output", stdout=result.stdout)
-            except subprocess.CalledProcessError as e:
-                logger.error("dbt failed", stderr=e.stderr, stdout=e.stdout)
-                raise RuntimeError(f"dbt run failed for model {model_name}: {e.stderr}")
+        profiles_dir = self._ensure_profiles_dir(target)
+
+        # Run dbt
+        self._run_dbt([model_name], profiles_dir, vars_dict, target)
 
-            # Export the model result to parquet
+        # Export the model result to parquet
+        try:
             self._export_to_parquet(model_name, output_path, profiles_dir, target)
+        finally:
+            # dbt needs an exclusive lock on dbt.duckdb for the next run
+            self._detach_dbt_db(Path(profiles_dir) / "dbt.duckdb")
 
-            logger.info("dbt transformation completed", model=model_name)
-            return output_path
+        logger.info("dbt transformation completed", model=model_name)
+        return output_path
 
     def run_transformations(
         self,
@@ -118,7 +169,8 @@ class DbtRunner:
         Returns:
             List of output parquet file paths
         """
-        output_paths: List[Path] = []
+        if not transformations:
+            return []
 
         # Prepare variables for dbt
         vars_dict = {
@@ -127,36 +179,130 @@ class DbtRunner:
             "stage": stage,
         }
 
-        for trans_config in transformations:
-            trans_name = trans_config["name"]
-            model_name = trans_config.get("model", trans_name)
-
-            logger.info("Processing dbt transformation", stage=stage, model=model_name)
+        jobs = [
+            (trans_config.get("model", trans_config["name"]),
+             output_dir / f"{trans_config['name']}.parquet")
+            for trans_config in transformations
+        ]
+        model_names = [model_name for model_name, _ in jobs]
+
+        logger.info(
+            "Processing dbt transformations", stage=stage, models=model_names
+        )
+
+        # One dbt invocation selecting every model: the ~seconds of dbt
+        # startup and profile parsing are paid once instead of per model, and
+        # dbt's own DAG scheduler parallelizes the models internally.
+        profiles_dir = self._ensure_profiles_dir("dev")
+        self._run_dbt(model_names, profiles_dir, vars_dict, "dev")
+
+        # Exports are independent per model, so overlap them; each runs
+        # on a cursor of the shared connection and the work is I/O-bound.
+        def _export(job: tuple[str, Path]) -> Path:
+            model_name, output_path = job
+            self._export_to_parquet(model_name, output_path, profiles_dir, "dev")
+            return output_path
 
-            # Determine output path
-            output_path = output_dir / f"{trans_name}.parquet"
+        max_workers = min(len(jobs), os.cpu_count() or 4)
+        try:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                return list(executor.map(_export, jobs))
+        finally:
+            self._detach_dbt_db(Path(profiles_dir) / "dbt.duckdb")
 
-            # Run the transformation
-            result_path = self.run_transformation(
-                model_name=model_name,
-                output_path=output_path,
-                vars_dict=vars_dict,
-                target="dev",
+    def _run_dbt(
+        self,
+        model_names: List[str],
+        profiles_dir: str,
+        vars_dict: Dict[str, Any] | None,
+        target: str,
+    ) -> None:
+        """Run `dbt run` once for the selected models."""
+        cmd = [
+            "dbt",
+            "run",
+            "--profiles-dir",
+            profiles_dir,
+            "--project-dir",
+            str(self.dbt_project_path),
+            "--select",
+            *model_names,
+            "--target",
+            target,
+        ]
+        if vars_dict:
+            cmd.extend(["--vars", self._vars_to_json(vars_dict)])
+
+        returncode, stderr_tail = self._stream_dbt(cmd)
+        if returncode != 0:
+            logger.error("dbt failed", stderr=stderr_tail)
+            raise RuntimeError(
+                f"dbt run failed for models {', '.join(model_names)}: {stderr_tail}"
             )
-            output_paths.append(result_path)
 
-        return output_paths
+        # The run rewrote target/manifest.json; drop the cached path map
+        self._compiled_paths = None
+
+    def _stream_dbt(self, cmd: List[str]) -> tuple[int, str]:
+        """
+        Run a dbt command, streaming its output line-by-line to the logger.
+
+        Streaming avoids buffering the whole multi-hundred-KB dbt log in
+        memory (capture_output holds both pipes until exit) and surfaces
+        progress live. Only a bounded tail of stderr is retained for error
+        reporting.
+
+        Returns:
+            Tuple of (return code, joined stderr tail)
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            cwd=str(self.dbt_project_path),
+        )
+        stderr_tail: deque[str] = deque(maxlen=100)
+
+        # Multiplex both pipes on one thread instead of a reader thread each
+        sel = selectors.DefaultSelector()
+        sel.register(proc.stdout, selectors.EVENT_READ)
+        sel.register(proc.stderr, selectors.EVENT_READ)
+        open_streams = 2
+        while open_streams:
+            for key, _ in sel.select():
+                line = key.fileobj.readline()
+                if not line:
+                    sel.unregister(key.fileobj)
+                    open_streams -= 1
+                    continue
+                if key.fileobj is proc.stderr:
+                    stderr_tail.append(line)
+                    logger.debug("dbt stderr", line=line.rstrip())
+                else:
+                    logger.debug("dbt output", line=line.rstrip())
+        sel.close()
+
+        return proc.wait(), "".join(stderr_tail)
 
     def _generate_profiles_yml(self, profiles_dir: Path, target: str) -> None:
-        """Generate profiles.yml for dbt execution."""
+        """
+        Generate profiles.yml for dbt execution.
+
+        dbt materializes into a file-backed DuckDB database next to the
+        profiles, so the export step can COPY the already-computed relations
+        out instead of re-executing the compiled SQL a second time.
+        """
         profiles_config = {
             "comboi": {
                 "target": target,
                 "outputs": {
                     target: {
                         "type": "duckdb",
-                        "path": ":memory:",
-                        "extensions": ["parquet", "httpfs"],
+                        "path": str(profiles_dir / "dbt.duckdb"),
+                        # azure handles abfss:// natively with a pooled
+                        # authenticated session; httpfs stays for plain https
+                        "extensions": ["parquet", "httpfs", "azure"],
                         "settings": {
                             "threads": 4,
                         },
@@ -174,7 +320,7 @@ class DbtRunner:
 
         profiles_file = profiles_dir / "profiles.yml"
         with profiles_file.open("w") as f:
-            yaml.dump(profiles_config, f)
+            yaml.dump(profiles_config, f, Dumper=YamlDumper)
 
         logger.debug("Generated profiles.yml", path=str(profiles_file))
 
@@ -190,52 +336,70 @@ class DbtRunner:
             profiles_dir: Directory containing profiles.yml
             target: dbt target name
         """
-        import duckdb
-
-        # dbt materializes models in the target schema (default: memory database)
-        # We need to query the materialized table and export to parquet
-
-        # Read the dbt target configuration to understand where data is
-        target_path = self.dbt_project_path / "target"
-
-        # For in-memory duckdb, we need to re-run the SQL to get results
-        # Alternative: configure dbt to materialize to a file-based duckdb database
-
-        # For now, we'll use a simpler approach: read the compiled SQL and execute it
-        compiled_sql_path = target_path / "compiled" / "comboi_dbt" / "models"
-
-        # Find the compiled SQL file
-        sql_file = None
-        for root, dirs, files in os.walk(compiled_sql_path):
-            for file in files:
-                if file == f"{model_name}.sql":
-                    sql_file = Path(root) / file
-                    break
-            if sql_file:
-                break
-
-        if not sql_file or not sql_file.exists():
-            raise FileNotFoundError(
-                f"Compiled SQL for model {model_name} not found in {compiled_sql_path}"
-            )
-
-        # Read and execute the compiled SQL
-        with sql_file.open("r") as f:
-            compiled_sql = f.read()
-
-        # Create DuckDB connection and export
-        con = duckdb.connect(":memory:")
+        # Ensure output directory exists
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        db_path = Path(profiles_dir) / "dbt.duckdb"
+        if db_path.exists():
+            # dbt materialized into the file-backed database: copy the
+            # already-computed relation out instead of re-executing the
+            # model's SQL a second time.
+            alias = self._attach_dbt_db(db_path)
+            source = f"SELECT * FROM {alias}.{model_name}"
+        else:
+            # Fallback (e.g. profiles generated elsewhere with an in-memory
+            # target): re-execute the compiled SQL.
+            source = self._read_compiled_sql(model_name)
+
+        # Export on a cursor of the shared connection; cursors are safe to
+        # use from the parallel export workers while the loaded extensions
+        # and buffer cache are shared.
+        cursor = self._get_con().cursor()
         try:
-            # Ensure output directory exists
-            output_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Execute the compiled SQL and export to parquet
-            con.execute(
-                f"COPY ({compiled_sql}) TO '{output_path.as_posix()}' (FORMAT PARQUET)"
+            cursor.execute(
+                f"COPY ({source}) TO '{output_path.as_posix()}' "
+                f"({parquet_copy_options()})"
             )
             logger.debug("Exported model to parquet", model=model_name, path=str(output_path))
         finally:
-            con.close()
+            cursor.close()
+
+    def _get_compiled_paths(self) -> Dict[str, Path]:
+        """
+        Map model names to their compiled SQL paths from target/manifest.json.
+
+        The manifest records the exact compiled path per model, so one JSON
+        parse (cached on the instance) replaces a directory walk per model.
+        """
+        if self._compiled_paths is None:
+            paths: Dict[str, Path] = {}
+            manifest_file = self.dbt_project_path / "target" / "manifest.json"
+            if manifest_file.exists():
+                manifest = json.loads(manifest_file.read_text())
+                for node in manifest.get("nodes", {}).values():
+                    compiled_path = node.get("compiled_path")
+                    if node.get("resource_type") == "model" and compiled_path:
+                        paths[node["name"]] = self.dbt_project_path / compiled_path
+            self._compiled_paths = paths
+        return self._compiled_paths
+
+    def _read_compiled_sql(self, model_name: str) -> str:
+        """Locate and read the compiled SQL for a model under target/."""
+        sql_file = self._get_compiled_paths().get(model_name)
+
+        if sql_file is None or not sql_file.exists():
+            # Fallback: recursive glob with early exit instead of a full
+            # directory walk per model.
+            compiled_sql_path = (
+                self.dbt_project_path / "target" / "compiled" / "comboi_dbt" / "models"
+            )
+            sql_file = next(compiled_sql_path.rglob(f"{model_name}.sql"), None)
+            if sql_file is None:
+                raise FileNotFoundError(
+                    f"Compiled SQL for model {model_name} not found in {compiled_sql_path}"
+                )
+
+        return sql_file.read_text()
 
     def _vars_to_json(self, vars_dict: Dict[str, Any]) -> str:
         """Convert variables dict to JSON string for dbt --vars parameter."""
@@ -258,34 +422,26 @@ class DbtRunner:
         """
         logger.info("Running dbt tests", model=model_name or "all")
 
-        with tempfile.TemporaryDirectory() as profiles_dir:
-            self._generate_profiles_yml(Path(profiles_dir), target)
-
-            cmd = [
-                "dbt",
-                "test",
-                "--profiles-dir",
-                profiles_dir,
-                "--project-dir",
-                str(self.dbt_project_path),
-                "--target",
-                target,
-            ]
-
-            if model_name:
-                cmd.extend(["--select", model_name])
-
-            try:
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=True,
-                    cwd=str(self.dbt_project_path),
-                )
-                logger.info("dbt tests passed", model=model_name or "all")
-                logger.debug("dbt test output", stdout=result.stdout)
-                return True
-            except subprocess.CalledProcessError as e:
-                logger.error("dbt tests failed", stderr=e.stderr, stdout=e.stdout)
-                return False
+        profiles_dir = self._ensure_profiles_dir(target)
+
+        cmd = [
+            "dbt",
+            "test",
+            "--profiles-dir",
+            profiles_dir,
+            "--project-dir",
+            str(self.dbt_project_path),
+            "--target",
+            target,
+        ]
+
+        if model_name:
+            cmd.extend(["--select", model_name])
+
+        returncode, stderr_tail = self._stream_dbt(cmd)
+        if returncode != 0:
+            logger.error("dbt tests failed", stderr=stderr_tail)
+            return False
+
+        logger.info("dbt tests passed", model=model_name or "all")
+        return True
@@ -3,10 +3,71 @@
 from __future__ import annotations
 
 import hashlib
+import warnings
 from typing import Any, Dict, List, Optional
 
 import duckdb
 
+# SAP B1 table schemas are stable within a pipeline run, so the DESCRIBE
+# result (a planner invocation plus a Parquet footer parse on object storage)
+# is cached per source path and paid once per process instead of per export.
+_SCHEMA_CACHE: Dict[str, List[str]] = {}
+
+
+def _get_source_columns(
+    con: duckdb.DuckDBPyConnection,
+    source: str,
+    cache_key: Optional[str] = None,
+    params: Optional[List[Any]] = None,
+) -> List[str]:
+    """
+    Return the column names of a source relation, cached by cache_key.
+
+    The source may carry ``?`` placeholders (e.g. an incremental filter);
+    DESCRIBE still plans the query, so their values must be bound.
+    """
+    if cache_key is not None and cache_key in _SCHEMA_CACHE:
+        return _SCHEMA_CACHE[cache_key]
+    rows = con.execute(
+        f"DESCRIBE SELECT * FROM {source} AS src", params or []
+    ).fetchall()
+    columns = [row[0] for row in rows]
+    if cache_key is not None:
+        _SCHEMA_CACHE[cache_key] = columns
+    return columns
+
+
+# SQL hash function per configured algorithm name
+_HASH_FUNCS = {"sha256": "SHA256", "sha512": "SHA512", "md5": "MD5"}
+
+
+def _build_gdpr_projection(columns: List[str], gdpr_config: Dict[str, Any]) -> List[str]:
+    """Build the SELECT-list fragments for a GDPR config over the given columns."""
+    exclude_columns = set(gdpr_config.get("exclude_columns", []))
+    pseudonymize_columns = set(gdpr_config.get("pseudonymize", []))
+    retain_columns = set(gdpr_config.get("retain", []))
+    hash_func = _HASH_FUNCS.get(gdpr_config.get("hash_algorithm", "sha256"))
+
+    select_parts = []
+    for col_name in columns:
+        # Skip excluded columns (PII to remove)
+        if col_name in exclude_columns:
+            continue
+
+        # Pseudonymize specified columns
+        if col_name in pseudonymize_columns:
+            if hash_func:
+                select_parts.append(
+                    f"{hash_func}(CAST({col_name} AS VARCHAR)) AS {col_name}_Hash"
+                )
+            continue
+
+        # Retain columns as-is; if no retain list specified, keep all non-excluded
+        if not retain_columns or col_name in retain_columns:
+            select_parts.append(col_name)
+
+    return select_parts
+
 
 class GDPRProcessor:
     """Handles GDPR-compliant data processing including pseudonymization."""
@@ -14,7 +75,14 @@ class GDPRProcessor:
     @staticmethod
     def pseudonymize_value(value: Any, algorithm: str = "sha256") -> str:
         """
-        Pseudonymize a value using the specified hashing algorithm.
+        Pseudonymize a single value using the specified hashing algorithm.
+
+        .. deprecated::
+            Hashing row-by-row from Python pays per-value boxing and call
+            overhead. Pseudonymization should go through
+            :meth:`apply_gdpr_rules`, where DuckDB's SHA functions run
+            vectorized over whole column chunks. This scalar path is kept
+            only for ad-hoc use (e.g. checking a single hash by hand).
 
         Args:
             value: The value to pseudonymize
@@ -23,6 +91,12 @@ class GDPRProcessor:
         Returns:
             Hexadecimal hash string
         """
+        warnings.warn(
+            "pseudonymize_value is deprecated; use apply_gdpr_rules so "
+            "hashing runs vectorized inside DuckDB",
+            DeprecationWarning,
+            stacklevel=2,
+        )
         if value is None or value == "":
             return None
 
@@ -40,71 +114,62 @@ class GDPRProcessor:
     @staticmethod
     def apply_gdpr_rules(
         con: duckdb.DuckDBPyConnection,
-        table_name: str,
+        source: str,
         gdpr_config: Dict[str, Any],
+        schema_cache_key: Optional[str] = None,
+        table_name: Optional[str] = None,
+        params: Optional[List[Any]] = None,
     ) -> str:
         """
-        Generate SQL to apply GDPR rules to a table.
+        Generate SQL to apply GDPR rules to a source relation.
+
+        The returned query names the retained/pseudonymized columns explicitly
+        in its projection, directly over the source. DuckDB propagates that
+        column list into the Parquet reader, so excluded PII columns are never
+        decoded from storage rather than being read and thrown away.
 
         Args:
             con: DuckDB connection
-            table_name: Name of the source table
+            source: FROM-able SQL fragment — a table name or a parenthesized
+                subquery such as "(SELECT * FROM read_parquet('...'))"
             gdpr_config: GDPR configuration with exclude_columns, pseudonymize, and retain
+            schema_cache_key: Optional stable key (e.g. the source storage
+                path) under which to cache the column list, avoiding a
+                DESCRIBE metadata round-trip on repeat exports
+            table_name: Optional SAP B1 table name; when its projection was
+                precompiled at import time (tables with an explicit retain
+                list), the SELECT list is a dict lookup with no DESCRIBE and
+                no per-call string building
+            params: Values for any ``?`` placeholders the source carries
+                (e.g. an incremental checkpoint), needed when the DESCRIBE
+                fallback has to plan it
 
         Returns:
             SQL query string with GDPR transformations applied
         """
-        # Get all columns from the source table
-        columns_query = f"DESCRIBE SELECT * FROM {table_name}"
-        columns_result = con.execute(columns_query).fetchall()
-        all_columns = {row[0]: row[1] for row in columns_result}
-
         # Handle retain_all case
         if gdpr_config.get("retain_all", False):
-            return f"SELECT * FROM {table_name}"
-
-        # Get GDPR configuration
-        exclude_columns = set(gdpr_config.get("exclude_columns", []))
-        pseudonymize_columns = set(gdpr_config.get("pseudonymize", []))
-        retain_columns = set(gdpr_config.get("retain", []))
-        algorithm = gdpr_config.get("hash_algorithm", "sha256")
-
-        # Build SELECT clause
-        select_parts = []
-
-        for col_name in all_columns.keys():
-            # Skip excluded columns (PII to remove)
-            if col_name in exclude_columns:
-                continue
-
-            # Pseudonymize specified columns
-            if col_name in pseudonymize_columns:
-                if algorithm == "sha256":
-                    select_parts.append(
-                        f"SHA256(CAST({col_name} AS VARCHAR)) AS {col_name}_Hash"
-                    )
-                elif algorithm == "sha512":
-                    select_parts.append(
-                        f"SHA512(CAST({col_name} AS VARCHAR)) AS {col_name}_Hash"
-                    )
-                elif algorithm == "md5":
-                    select_parts.append(
-                        f"MD5(CAST({col_name} AS VARCHAR)) AS {col_name}_Hash"
-                    )
-                continue
-
-            # Retain columns as-is
-            if retain_columns and col_name in retain_columns:
-                select_parts.append(col_name)
-            elif not retain_columns:  # If no retain list specified, keep all non-excluded
-                select_parts.append(col_name)
+            return f"SELECT * FROM {source} AS src"
+
+        # Precompiled fast path for the known SAP B1 rule set
+        if table_name:
+            projection = SAP_B1_GDPR_SQL.get(table_name.upper())
+            if projection:
+                return f"SELECT {projection} FROM {source} AS src"
+
+        # Enumerate the source columns (cached when a key is provided)
+        all_columns = _get_source_columns(
+            con, source, cache_key=schema_cache_key, params=params
+        )
+
+        select_parts = _build_gdpr_projection(all_columns, gdpr_config)
 
         if not select_parts:
             raise ValueError(
-                f"No columns to select after applying GDPR rules for table {table_name}"
+                f"No columns to select after applying GDPR rules for source {source}"
             )
 
-        return f"SELECT {', '.join(select_parts)} FROM {table_name}"
+        return f"SELECT {', '.join(select_parts)} FROM {source} AS src"
 
 
 # Pre-defined GDPR rules for SAP B1 tables
@@ -199,6 +264,29 @@ SAP_B1_GDPR_RULES = {
 }
 
 
+def _precompile_sap_b1_sql() -> Dict[str, str]:
+    """
+    Precompute the GDPR projection list for each SAP B1 table whose rules name
+    an explicit retain list.
+
+    For those tables the output columns are fully determined by the rules
+    (retained columns plus pseudonymized hashes), so the SELECT list is a
+    constant: building it at import time turns the per-export work — a
+    DESCRIBE round-trip plus the Python loop with set lookups and string
+    concatenation — into a single dict lookup.
+    """
+    compiled = {}
+    for table, rules in SAP_B1_GDPR_RULES.items():
+        if rules.get("retain_all") or not rules.get("retain"):
+            continue
+        columns = list(rules["retain"]) + list(rules.get("pseudonymize", []))
+        compiled[table] = ", ".join(_build_gdpr_projection(columns, rules))
+    return compiled
+
+
+SAP_B1_GDPR_SQL: Dict[str, str] = _precompile_sap_b1_sql()
+
+
 def get_sap_b1_table_config(table_name: str) -> Optional[Dict[str, Any]]:
     """
     Get GDPR configuration for a specific SAP B1 table.
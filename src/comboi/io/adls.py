@@ -32,11 +32,19 @@ class ADLSClient:
             local_path=str(local_path),
             remote_path=f"abfs://{self.file_system}/{remote_path}",
         )
-        with local_path.open("rb") as data:
-            fs.upload(
-                data,
+        if local_path.is_dir():
+            # Partitioned parquet output: mirror the directory tree.
+            fs.put(
+                str(local_path),
                 f"{self.file_system}/{remote_path}",
-                overwrite=True,
+                recursive=True,
             )
+        else:
+            with local_path.open("rb") as data:
+                fs.upload(
+                    data,
+                    f"{self.file_system}/{remote_path}",
+                    overwrite=True,
+                )
         return f"abfs://{self.file_system}/{remote_path}"
 
@@ -20,22 +20,37 @@ class BronzeStage:
 
     def run(self, sources: List[Dict], stage_conf: Dict) -> List[str]:
         outputs: List[str] = []
+        max_workers = stage_conf.get("max_export_workers", 4)
         for src in sources:
             connector = self._build_connector(src)
+            jobs = []
+            remote_paths = []
             for table in src["tables"]:
                 bronze_path = self.local_landing / src["name"] / f"{table['name']}.parquet"
                 bronze_path.parent.mkdir(parents=True, exist_ok=True)
 
-                remote_path = stage_conf["remote_path_template"].format(
-                    stage="bronze",
-                    source=src["name"],
-                    table=table["name"],
+                remote_paths.append(
+                    stage_conf["remote_path_template"].format(
+                        stage="bronze",
+                        source=src["name"],
+                        table=table["name"],
+                    )
                 )
                 checkpoint_key = table.get("checkpoint_key", src.get("checkpoint_key"))
+                jobs.append((table, bronze_path, checkpoint_key))
 
-                exported = connector.export_table(
-                    table, bronze_path, checkpoint_key=checkpoint_key
-                )
+            # Batch the exports so the connector can run them concurrently on
+            # its shared connection; connectors without batch support fall back
+            # to the per-table loop.
+            if hasattr(connector, "export_tables"):
+                exported_paths = connector.export_tables(jobs, max_workers=max_workers)
+            else:
+                exported_paths = [
+                    connector.export_table(table, path, checkpoint_key=key)
+                    for table, path, key in jobs
+                ]
+
+            for exported, remote_path in zip(exported_paths, remote_paths):
                 remote_uri = self.data_lake.upload(exported, remote_path)
                 outputs.append(remote_uri)
         logger.info("Bronze stage completed", parquet_files=len(outputs))
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from comboi.bruin_runner import BruinRunner
 from comboi.dbt_runner import DbtRunner
@@ -43,36 +44,8 @@ class GoldStage:
         bruin_transforms = [t for t in gold_transforms if t.get("type", "bruin") == "bruin"]
         dbt_transforms = [t for t in gold_transforms if t.get("type", "bruin") == "dbt"]
 
-        # Run bruin transformations
-        input_base_paths = {"silver": silver_base_path}
-        bruin_outputs = []
-        if bruin_transforms:
-            bruin_outputs = bruin_runner.run_transformations(
-                "gold",
-                bruin_transforms,
-                self.local_gold,
-                input_base_paths,
-            )
-
-        # Run dbt transformations
-        dbt_outputs = []
-        if dbt_transforms:
-            if not dbt_runner:
-                raise RuntimeError(
-                    f"dbt transformations configured but dbt project not found at {dbt_project_path}"
-                )
-            dbt_outputs = dbt_runner.run_transformations(
-                "gold",
-                dbt_transforms,
-                self.local_gold,
-                input_base_paths,
-            )
-
-        # Combine outputs and upload each transformation to ADLS
-        all_transforms = bruin_transforms + dbt_transforms
-        all_outputs = bruin_outputs + dbt_outputs
-
-        for trans_config, output_path in zip(all_transforms, all_outputs):
+        def _upload(job: Tuple[Dict, Path]) -> str:
+            trans_config, output_path = job
             trans_name = trans_config["name"]
             logger.info("Uploading Gold transformation", transformation=trans_name)
 
@@ -81,8 +54,50 @@ class GoldStage:
                 source="metrics",
                 table=trans_name,
             )
-            remote_uri = self.data_lake.upload(output_path, remote_path)
-            outputs.append(remote_uri)
+            return self.data_lake.upload(output_path, remote_path)
+
+        # Uploads run on a background pool and are submitted as soon as each
+        # runner's outputs exist, so the network transfer of the bruin
+        # metrics overlaps the dbt run instead of waiting for the whole
+        # stage's compute to finish.
+        input_base_paths = {"silver": silver_base_path}
+        upload_pool = ThreadPoolExecutor(max_workers=4)
+        futures = []
+        try:
+            # Run bruin transformations
+            if bruin_transforms:
+                bruin_outputs = bruin_runner.run_transformations(
+                    "gold",
+                    bruin_transforms,
+                    self.local_gold,
+                    input_base_paths,
+                )
+                futures += [
+                    upload_pool.submit(_upload, job)
+                    for job in zip(bruin_transforms, bruin_outputs)
+                ]
+
+            # Run dbt transformations
+            if dbt_transforms:
+                if not dbt_runner:
+                    raise RuntimeError(
+                        f"dbt transformations configured but dbt project not found at {dbt_project_path}"
+                    )
+                dbt_outputs = dbt_runner.run_transformations(
+                    "gold",
+                    dbt_transforms,
+                    self.local_gold,
+                    input_base_paths,
+                )
+                futures += [
+                    upload_pool.submit(_upload, job)
+                    for job in zip(dbt_transforms, dbt_outputs)
+                ]
+
+            # Futures were submitted in transformation order
+            outputs = [future.result() for future in futures]
+        finally:
+            upload_pool.shutdown(wait=True)
 
         logger.info("Gold stage completed", metrics_produced=len(outputs))
         return outputs
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import duckdb
 from splink.duckdb.duckdb_linker import DuckDBLinker
 
 from comboi.bruin_runner import BruinRunner
 from comboi.bruin_quality import BruinQualityRunner
+from comboi.connectors.base import parquet_copy_options
 from comboi.dbt_runner import DbtRunner
 from comboi.io.adls import ADLSClient
 from comboi.logging import get_logger
@@ -77,18 +80,28 @@ class SilverStage:
         all_transforms = bruin_transforms + dbt_transforms
         all_outputs = bruin_outputs + dbt_outputs
 
-        # Process each transformation output
-        for trans_config, output_path in zip(all_transforms, all_outputs):
+        # One quality runner for the whole stage: its shared DuckDB
+        # connection and any contract parsing are reused across datasets,
+        # and its per-call cursors are safe for the thread pool below.
+        quality_runner = None
+        if any("quality_checks" in t for t in all_transforms):
+            quality_runner = BruinQualityRunner(
+                transformations_path=transformations_path,
+                contracts_path=contracts_path,
+            )
+
+        # Process each transformation output. Datasets are independent, so
+        # run them on a small thread pool: each query runs on its own DuckDB
+        # connection (one query per connection) and the ADLS upload of one
+        # dataset overlaps the quality/dedup compute of the next.
+        def _process(job: Tuple[Dict, Path]) -> str:
+            trans_config, output_path = job
             trans_name = trans_config["name"]
             logger.info("Processing Silver transformation", transformation=trans_name)
 
             # Run quality checks (supports contracts via "contract:" prefix)
             # Quality checks work for both bruin and dbt transformations
             if "quality_checks" in trans_config:
-                quality_runner = BruinQualityRunner(
-                    transformations_path=transformations_path,
-                    contracts_path=contracts_path,
-                )
                 quality_runner.run_quality_checks(
                     trans_config["quality_checks"],
                     output_path,
@@ -104,8 +117,13 @@ class SilverStage:
             remote_path = stage_conf["remote_path_template"].format(
                 stage="silver", source="refined", table=trans_name
             )
-            remote_uri = self.data_lake.upload(output_path, remote_path)
-            outputs.append(remote_uri)
+            return self.data_lake.upload(output_path, remote_path)
+
+        jobs = list(zip(all_transforms, all_outputs))
+        max_workers = min(stage_conf.get("max_process_workers", 4), len(jobs))
+        if jobs:
+            with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+                outputs = list(executor.map(_process, jobs))
 
         logger.info("Silver stage completed", datasets_produced=len(outputs))
         return outputs
@@ -116,23 +134,58 @@ class SilverStage:
             return
         trans_name = trans_config["name"]
         logger.info("Running Splink deduplication", transformation=trans_name)
-        linker = DuckDBLinker(
-            input_table_or_tables=[
-                {
-                    "table_name": trans_name,
-                    "sql": f"SELECT * FROM read_parquet('{local_path.as_posix()}')",
-                }
-            ],
-            settings_dict=splink_cfg,
-        )
-        splink_df = linker.deduplicate_table(
-            trans_name,
-            blocking_rule=splink_cfg.get("blocking_rule"),
-            retain_matching_columns=True,
-        )
-        tmp_path = local_path.with_suffix(".dedup.parquet")
-        linker.duckdb_connection().execute(
-            f"COPY (SELECT * FROM {splink_df.physical_name}) TO '{tmp_path.as_posix()}' (FORMAT PARQUET)"
+
+        # Several narrow blocking rules generate far fewer candidate pairs
+        # than one broad rule: Splink unions the blocks, so each rule can be
+        # tight (e.g. same postcode, same surname) without losing recall,
+        # avoiding the O(n²) blow-up of a single skewed block.
+        settings = dict(splink_cfg)
+        blocking_rules = settings.pop("blocking_rules", None)
+        if blocking_rules:
+            settings.setdefault(
+                "blocking_rules_to_generate_predictions", blocking_rules
+            )
+
+        # Hand Splink a tuned connection instead of letting it open its own
+        # default engine: full parallelism and a real memory budget for the
+        # pairwise comparisons, and the final COPY runs in the same session
+        # the dedup table was materialized in. One connection per dataset —
+        # _process runs datasets on concurrent threads.
+        con = duckdb.connect(
+            config={
+                "threads": os.cpu_count() or 4,
+                "memory_limit": os.getenv("COMBOI_DUCKDB_MEM", "4GB"),
+                "preserve_insertion_order": "false",
+            }
         )
-        tmp_path.replace(local_path)
+        try:
+            linker = DuckDBLinker(
+                input_table_or_tables=[
+                    {
+                        "table_name": trans_name,
+                        "sql": f"SELECT * FROM read_parquet('{local_path.as_posix()}')",
+                    }
+                ],
+                settings_dict=settings,
+                connection=con,
+            )
+            # Retaining the _l/_r comparison columns can more than double the
+            # output width, dominating the parquet write and upload for wide
+            # tables — keep them opt-in for the configs that actually review
+            # match evidence downstream.
+            splink_df = linker.deduplicate_table(
+                trans_name,
+                blocking_rule=splink_cfg.get("blocking_rule"),
+                retain_matching_columns=splink_cfg.get("retain_matching_columns", False),
+            )
+            # The dedup result is already materialized in Splink's DuckDB
+            # table, so the source file is no longer read: write straight
+            # over it instead of a second full write to a temp file plus
+            # rename.
+            con.execute(
+                f"COPY (SELECT * FROM {splink_df.physical_name}) "
+                f"TO '{local_path.as_posix()}' ({parquet_copy_options()})"
+            )
+        finally:
+            con.close()
 
@@ -2,13 +2,24 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from comboi.checkpoint import CheckpointStore
-from comboi.config import load_config
-from comboi.pipeline.driver import Driver
+if TYPE_CHECKING:
+    from comboi.pipeline.driver import Driver
+
+# Resolved once per process; resolve() walks realpath(3) per path component,
+# which is wasteful to repeat for a constant location.
+_PKG_ROOT = str(Path(__file__).resolve().parents[2])
 
 
 def create_driver(config_path: Path, transformations_path: Path | None = None) -> Driver:
+    # Deferred imports: the driver drags in DuckDB, yaml, and the connector
+    # modules, which would otherwise be paid on every `import comboi.runner`
+    # during Azure Function cold starts.
+    from comboi.checkpoint import CheckpointStore
+    from comboi.config import load_config
+    from comboi.pipeline.driver import Driver
+
     resolved_config = _resolve_path(config_path)
     # Try to find transformations.yml in the same directory as the config
     if transformations_path is None:
@@ -23,22 +34,29 @@ def create_driver(config_path: Path, transformations_path: Path | None = None) -
 
 
 def _resolve_path(path: Path) -> Path:
-    if path.is_absolute():
-        return path
-    root = Path(__file__).resolve().parents[2]
-    candidate = (root / path).resolve()
-    if candidate.exists():
-        return candidate
-    return (Path.cwd() / path).resolve()
+    # Walk the candidates with os.path primitives: one stat for the repo-root
+    # candidate instead of resolve()+exists() (realpath plus stat) per
+    # candidate.
+    p = os.fspath(path)
+    if os.path.isabs(p):
+        return Path(p)
+    candidate = os.path.join(_PKG_ROOT, p)
+    if os.path.exists(candidate):
+        return Path(os.path.normpath(candidate))
+    return Path(os.path.normpath(os.path.join(os.getcwd(), p)))
 
 
 def _resolve_relative(path: Path, base: Path) -> Path:
     if path.is_absolute():
         return path
-    return (base / path).resolve()
+    # normpath is pure string manipulation; unlike Path.resolve() it issues no
+    # realpath syscalls. The base is canonicalized once by the caller.
+    return Path(os.path.normpath(os.path.join(str(base), str(path))))
 
 
 def _normalize_paths(config, base: Path) -> None:
+    # Resolve the shared base once instead of re-stating it per stage path
+    base = base.resolve()
     config.monitoring.log_path = _resolve_relative(Path(config.monitoring.log_path), base)
     config.monitoring.metrics_path = _resolve_relative(Path(config.monitoring.metrics_path), base)
 
@@ -10,127 +10,188 @@ Usage:
 """
 
 import argparse
+import string
 import sys
 from pathlib import Path
 from textwrap import dedent
 
+# Templates are dedented once at import and substituted per call, so bulk
+# scaffolding (e.g. loops in CI) doesn't re-scan the multi-hundred-char
+# bodies on every invocation.
+_DBT_MODEL_TPL = string.Template(dedent("""
+    {{ config(
+        materialized='table',
+        tags=['${stage}', '${industry}']
+    ) }}
+
+    /*
+    ${industry_title} ${stage_title} Layer: ${title}
+
+    TODO: Add transformation description here
+
+    This transformation:
+    - TODO: Describe what it does
+    - TODO: Describe business logic
+    - TODO: Describe quality checks
+    */
+
+    WITH bronze_data AS (
+        -- Load from bronze layer
+        SELECT * FROM read_parquet('{{ var("bronze_base_path") }}/${industry}/source_table.parquet')
+    ),
+
+    cleansed AS (
+        -- Cleanse and standardize
+        SELECT
+            id,
+            CAST(timestamp_field AS TIMESTAMP) AS timestamp_field,
+            LOWER(TRIM(text_field)) AS text_field,
+            CAST(numeric_field AS DECIMAL(18,2)) AS numeric_field
+        FROM bronze_data
+        WHERE id IS NOT NULL
+    ),
+
+    transformed AS (
+        -- Apply business logic
+        SELECT
+            *,
+            -- Add calculated fields here
+            numeric_field * 2 AS calculated_field
+        FROM cleansed
+    )
 
-def create_dbt_model(name: str, stage: str, industry: str) -> None:
-    """Create a dbt SQL model template."""
-    model_path = Path(f"transformations/dbt/models/{stage}/{name}.sql")
-    model_path.parent.mkdir(parents=True, exist_ok=True)
+    SELECT * FROM transformed
+    WHERE true  -- Add quality filters here
+""").strip())
 
-    template = dedent(f"""
-        {{{{ config(
-            materialized='table',
-            tags=['{stage}', '{industry}']
-        ) }}}}
-
-        /*
-        {industry.title()} {stage.title()} Layer: {name.replace('_', ' ').title()}
-
-        TODO: Add transformation description here
-
-        This transformation:
-        - TODO: Describe what it does
-        - TODO: Describe business logic
-        - TODO: Describe quality checks
-        */
-
-        WITH bronze_data AS (
-            -- Load from bronze layer
-            SELECT * FROM read_parquet('{{{{ var("bronze_base_path") }}}}/{industry}/source_table.parquet')
-        ),
-
-        cleansed AS (
-            -- Cleanse and standardize
-            SELECT
-                id,
-                CAST(timestamp_field AS TIMESTAMP) AS timestamp_field,
-                LOWER(TRIM(text_field)) AS text_field,
-                CAST(numeric_field AS DECIMAL(18,2)) AS numeric_field
-            FROM bronze_data
-            WHERE id IS NOT NULL
-        ),
-
-        transformed AS (
-            -- Apply business logic
-            SELECT
-                *,
-                -- Add calculated fields here
-                numeric_field * 2 AS calculated_field
-            FROM cleansed
-        )
-
-        SELECT * FROM transformed
-        WHERE true  -- Add quality filters here
-    """).strip()
-
-    with open(model_path, "w") as f:
-        f.write(template)
 
-    print(f"✅ Created dbt model: {model_path}")
+_BRUIN_TRANSFORM_TPL = string.Template(dedent('''
+    """
+    ${industry_title} Bruin Transformation: ${title}
 
+    TODO: Add transformation description here
 
-def create_bruin_transformation(name: str, stage: str, industry: str) -> None:
-    """Create a Bruin Python transformation template."""
-    transform_path = Path(f"transformations/bruin/{name}.py")
-    transform_path.parent.mkdir(parents=True, exist_ok=True)
+    This transformation performs:
+    - TODO: Describe complex logic
+    - TODO: Describe ML/statistical analysis
+    - TODO: Describe why Python is needed vs SQL
+    """
 
-    template = dedent(f'''
-        """
-        {industry.title()} Bruin Transformation: {name.replace('_', ' ').title()}
+    import pandas as pd
+    import numpy as np
 
-        TODO: Add transformation description here
 
-        This transformation performs:
-        - TODO: Describe complex logic
-        - TODO: Describe ML/statistical analysis
-        - TODO: Describe why Python is needed vs SQL
+    def transform(con, inputs):
         """
+        ${title} transformation.
 
-        import pandas as pd
-        import numpy as np
+        Args:
+            con: DuckDB connection
+            inputs: Dict mapping input aliases to file paths
 
+        Returns:
+            Either:
+            - SQL query string (for DuckDB execution)
+            - pandas DataFrame (for complex Python logic)
+        """
+        # Option 1: Return SQL query (simple transformations)
+        # return """
+        #     SELECT
+        #         *,
+        #         -- Add transformations here
+        #     FROM input_alias
+        #     WHERE condition
+        # """
+
+        # Option 2: Return DataFrame (complex Python logic)
+        df = con.execute("SELECT * FROM input_alias").df()
+
+        # Perform complex transformations
+        # TODO: Add your transformation logic here
+        df['new_column'] = df['existing_column'] * 2
+
+        # TODO: Add statistical analysis
+        # TODO: Add ML features
+        # TODO: Add complex business logic
+
+        return df
+''').strip())
+
+
+_DATA_CONTRACT_TPL = string.Template(dedent('''
+    version: "1.0.0"
+    dataset: "${name}"
+    stage: "${stage}"
+    owner: "${industry}-data-team"
+    description: "TODO: Add dataset description"
+
+    schema:
+      columns:
+        - name: id
+          type: VARCHAR
+          nullable: false
+          description: "Unique identifier"
+          constraints:
+            - unique: true
+            - not_null: true
+        # TODO: Add more columns
+
+    quality_rules:
+      - name: "no_duplicate_ids"
+        type: "uniqueness"
+        column: "id"
+        severity: "error"
+      - name: "no_null_ids"
+        type: "not_null"
+        column: "id"
+        severity: "error"
+      - name: "minimum_records"
+        type: "volume"
+        min_rows: 1
+        severity: "error"
+      # TODO: Add more quality rules
+
+    sla:
+      freshness:
+        max_age_hours: 24
+        schedule: "daily"
+      completeness:
+        min_row_count: 1
+
+    evolution:
+      backward_compatible: true
+      breaking_changes_allowed: false
+''').strip())
+
+
+def _template_fields(name: str, stage: str, industry: str) -> dict:
+    """Build the substitution mapping shared by all templates."""
+    return {
+        "name": name,
+        "stage": stage,
+        "industry": industry,
+        "title": name.replace("_", " ").title(),
+        "stage_title": stage.title(),
+        "industry_title": industry.title(),
+    }
 
-        def transform(con, inputs):
-            """
-            {name.replace('_', ' ').title()} transformation.
-
-            Args:
-                con: DuckDB connection
-                inputs: Dict mapping input aliases to file paths
 
-            Returns:
-                Either:
-                - SQL query string (for DuckDB execution)
-                - pandas DataFrame (for complex Python logic)
-            """
-            # Option 1: Return SQL query (simple transformations)
-            # return """
-            #     SELECT
-            #         *,
-            #         -- Add transformations here
-            #     FROM input_alias
-            #     WHERE condition
-            # """
+def create_dbt_model(name: str, stage: str, industry: str) -> None:
+    """Create a dbt SQL model template."""
+    model_path = Path(f"transformations/dbt/models/{stage}/{name}.sql")
+    model_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Option 2: Return DataFrame (complex Python logic)
-            df = con.execute("SELECT * FROM input_alias").df()
+    model_path.write_text(_DBT_MODEL_TPL.substitute(_template_fields(name, stage, industry)))
 
-            # Perform complex transformations
-            # TODO: Add your transformation logic here
-            df['new_column'] = df['existing_column'] * 2
+    print(f"✅ Created dbt model: {model_path}")
 
-            # TODO: Add statistical analysis
-            # TODO: Add ML features
-            # TODO: Add complex business logic
 
-            return df
-    ''').strip()
+def create_bruin_transformation(name: str, stage: str, industry: str) -> None:
+    """Create a Bruin Python transformation template."""
+    transform_path = Path(f"transformations/bruin/{name}.py")
+    transform_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(transform_path, "w") as f:
-        f.write(template)
+    transform_path.write_text(_BRUIN_TRANSFORM_TPL.substitute(_template_fields(name, stage, industry)))
 
     print(f"✅ Created Bruin transformation: {transform_path}")
 
@@ -140,53 +201,7 @@ def create_data_contract(name: str, stage: str, industry: str) -> None:
     contract_path = Path(f"transformations/contracts/{name}.yml")
     contract_path.parent.mkdir(parents=True, exist_ok=True)
 
-    template = dedent(f'''
-        version: "1.0.0"
-        dataset: "{name}"
-        stage: "{stage}"
-        owner: "{industry}-data-team"
-        description: "TODO: Add dataset description"
-
-        schema:
-          columns:
-            - name: id
-              type: VARCHAR
-              nullable: false
-              description: "Unique identifier"
-              constraints:
-                - unique: true
-                - not_null: true
-            # TODO: Add more columns
-
-        quality_rules:
-          - name: "no_duplicate_ids"
-            type: "uniqueness"
-            column: "id"
-            severity: "error"
-          - name: "no_null_ids"
-            type: "not_null"
-            column: "id"
-            severity: "error"
-          - name: "minimum_records"
-            type: "volume"
-            min_rows: 1
-            severity: "error"
-          # TODO: Add more quality rules
-
-        sla:
-          freshness:
-            max_age_hours: 24
-            schedule: "daily"
-          completeness:
-            min_row_count: 1
-
-        evolution:
-          backward_compatible: true
-          breaking_changes_allowed: false
-    ''').strip()
-
-    with open(contract_path, "w") as f:
-        f.write(template)
+    contract_path.write_text(_DATA_CONTRACT_TPL.substitute(_template_fields(name, stage, industry)))
 
     print(f"✅ Created data contract: {contract_path}")
 
@@ -0,0 +1,98 @@
+"""
+Ecommerce Bruin Transformation: Daily and Customer Metrics
+
+Consolidates the customers_clean / orders_clean / daily_sales /
+customer_metrics chain into one DuckDB query. Run separately, each step
+re-scanned its inputs and both metric tables re-aggregated the cleaned
+orders; as CTEs in a single statement the optimizer shares the cleaned
+scan, the daily rollup feeds overall totals, and the customer rollup is
+joined once onto the cleaned customers.
+
+Output grain is one row per customer, with the company-wide daily
+averages attached for context.
+"""
+
+
+def transform(con, inputs):
+    """
+    Daily and customer metrics transformation.
+
+    Args:
+        con: DuckDB connection with input views registered
+        inputs: Dict mapping input aliases to file paths
+
+    Returns:
+        SQL query string executed by the runner
+    """
+    return """
+        WITH orders_clean AS (
+            SELECT
+                order_id,
+                customer_id,
+                CAST(order_date AS DATE) AS order_date,
+                CAST(order_total AS DECIMAL(18,2)) AS order_total
+            FROM bronze_orders
+            WHERE order_id IS NOT NULL
+              AND customer_id IS NOT NULL
+              AND order_total >= 0
+        ),
+
+        customers_clean AS (
+            SELECT
+                customer_id,
+                LOWER(TRIM(email)) AS email,
+                TRIM(country) AS country,
+                CAST(signup_date AS DATE) AS signup_date
+            FROM bronze_customers
+            WHERE customer_id IS NOT NULL
+        ),
+
+        daily_sales AS (
+            SELECT
+                order_date,
+                SUM(order_total) AS daily_revenue,
+                COUNT(*) AS daily_orders,
+                AVG(order_total) AS avg_order_value
+            FROM orders_clean
+            GROUP BY order_date
+        ),
+
+        overall AS (
+            -- Reuses the daily rollup instead of re-aggregating orders
+            SELECT
+                AVG(daily_revenue) AS avg_daily_revenue,
+                AVG(daily_orders) AS avg_daily_orders,
+                SUM(daily_revenue) AS total_revenue
+            FROM daily_sales
+        ),
+
+        customer_metrics AS (
+            SELECT
+                customer_id,
+                COUNT(*) AS total_orders,
+                SUM(order_total) AS lifetime_value,
+                AVG(order_total) AS avg_order_value,
+                MIN(order_date) AS first_order_date,
+                MAX(order_date) AS last_order_date
+            FROM orders_clean
+            GROUP BY customer_id
+        )
+
+        SELECT
+            cc.customer_id,
+            cc.email,
+            cc.country,
+            cc.signup_date,
+            COALESCE(cm.total_orders, 0) AS total_orders,
+            COALESCE(cm.lifetime_value, 0) AS lifetime_value,
+            cm.avg_order_value,
+            cm.first_order_date,
+            cm.last_order_date,
+            COALESCE(cm.lifetime_value, 0) / NULLIF(o.total_revenue, 0) AS revenue_share,
+            o.avg_daily_revenue,
+            o.avg_daily_orders
+        FROM customers_clean cc
+        LEFT JOIN customer_metrics cm USING (customer_id)
+        CROSS JOIN overall o
+        ORDER BY lifetime_value DESC
+    """
@@ -0,0 +1,89 @@
+"""
+Finance Bruin Transformation: Fraud Detection Scoring
+
+Enriches the base fraud score on each transaction with account-level
+behavioural signals:
+- Per-account amount statistics (mean, std, max, count)
+- Outlier detection on amount deviation from the account mean
+- Unusual-hour and high-velocity flags
+- A combined enhanced fraud score and a low/medium/high risk bucket
+
+The whole pipeline is one DuckDB SQL query returned to the runner: the
+account statistics are window aggregates over the transactions and the
+score is a sum of CASE terms, all executed in DuckDB's vectorized engine.
+An earlier version materialized the table into pandas and accumulated the
+score with NumPy masks — vectorized, but still paying a full copy out of
+DuckDB and back; returning SQL keeps the data columnar end to end and
+lets the runner COPY the result straight to Parquet.
+"""
+
+
+def transform(con, inputs):
+    """
+    Fraud detection scoring transformation.
+
+    Args:
+        con: DuckDB connection with input views registered
+        inputs: Dict mapping input aliases to file paths
+
+    Returns:
+        SQL query string executed by the runner
+    """
+    return """
+        WITH scored AS (
+            SELECT
+                transaction_id,
+                account_id,
+                transaction_timestamp,
+                amount,
+                fraud_score,
+                EXTRACT(hour FROM transaction_timestamp) AS hour,
+                ABS(amount - AVG(amount) OVER acct) AS amount_deviation,
+                ABS(amount - AVG(amount) OVER acct)
+                    > 2 * COALESCE(STDDEV(amount) OVER acct, 0) AS is_outlier,
+                EXTRACT(hour FROM transaction_timestamp) NOT BETWEEN 6 AND 22
+                    AS is_unusual_hour,
+                COUNT(*) OVER acct > 100 AS is_high_velocity,
+                ABS(amount) > 0.9 * MAX(ABS(amount)) OVER acct AS is_near_max,
+                ABS(amount) > 2 * AVG(amount) OVER acct AS is_double_avg
+            FROM transactions
+            WINDOW acct AS (PARTITION BY account_id)
+        ),
+
+        enhanced AS (
+            SELECT
+                *,
+                ROUND(
+                    LEAST(
+                        fraud_score
+                        + CASE WHEN is_outlier THEN 0.3 ELSE 0 END
+                        + CASE WHEN is_unusual_hour THEN 0.1 ELSE 0 END
+                        + CASE WHEN is_near_max THEN 0.2 ELSE 0 END
+                        + CASE WHEN is_high_velocity AND is_double_avg
+                               THEN 0.15 ELSE 0 END,
+                        1.0
+                    ),
+                    3
+                ) AS enhanced_fraud_score
+            FROM scored
+        )
+
+        SELECT
+            transaction_id,
+            account_id,
+            transaction_timestamp,
+            amount,
+            amount_deviation,
+            is_outlier,
+            is_unusual_hour,
+            is_high_velocity,
+            fraud_score,
+            enhanced_fraud_score,
+            CASE
+                WHEN enhanced_fraud_score < 0.3 THEN 'low'
+                WHEN enhanced_fraud_score < 0.7 THEN 'medium'
+                ELSE 'high'
+            END AS fraud_risk_level
+        FROM enhanced
+        ORDER BY account_id, transaction_timestamp
+    """
@@ -0,0 +1,45 @@
+"""
+Quality checks for the cleaned customers dataset.
+
+All row-level assertions are folded into one aggregate query with
+COUNT(*) FILTER clauses (plus a scalar subquery for duplicates), so
+DuckDB scans the dataset once instead of once per check.
+"""
+
+
+def check(con, dataset_name):
+    """Run customer data quality checks; returns (passed, message)."""
+    total, null_ids, bad_emails, dupes = con.execute(
+        f"""
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE customer_id IS NULL) AS null_ids,
+            COUNT(*) FILTER (
+                WHERE email IS NOT NULL
+                  AND (email NOT LIKE '%@%.%' OR email LIKE '@%' OR email LIKE '%@')
+            ) AS bad_emails,
+            (
+                SELECT COUNT(*) FROM (
+                    SELECT customer_id FROM {dataset_name}
+                    WHERE customer_id IS NOT NULL
+                    GROUP BY customer_id
+                    HAVING COUNT(*) > 1
+                )
+            ) AS dupes
+        FROM {dataset_name}
+        """
+    ).fetchone()
+
+    failures = []
+    if total == 0:
+        failures.append("dataset is empty")
+    if null_ids > 0:
+        failures.append(f"{null_ids} rows with NULL customer_id")
+    if bad_emails > 0:
+        failures.append(f"{bad_emails} rows with malformed email")
+    if dupes > 0:
+        failures.append(f"{dupes} duplicated customer_id values")
+
+    if failures:
+        return False, "; ".join(failures)
+    return True, f"{total} customers passed all checks"
@@ -0,0 +1,45 @@
+"""
+Quality checks for the cleaned orders dataset.
+
+All row-level assertions are folded into one aggregate query with
+COUNT(*) FILTER clauses (plus a scalar subquery for duplicates), so
+DuckDB scans the dataset once instead of once per check.
+"""
+
+
+def check(con, dataset_name):
+    """Run order data quality checks; returns (passed, message)."""
+    total, null_ids, null_customers, negative_totals, dupes = con.execute(
+        f"""
+        SELECT
+            COUNT(*) AS total,
+            COUNT(*) FILTER (WHERE order_id IS NULL) AS null_ids,
+            COUNT(*) FILTER (WHERE customer_id IS NULL) AS null_customers,
+            COUNT(*) FILTER (WHERE order_total < 0) AS negative_totals,
+            (
+                SELECT COUNT(*) FROM (
+                    SELECT order_id FROM {dataset_name}
+                    WHERE order_id IS NOT NULL
+                    GROUP BY order_id
+                    HAVING COUNT(*) > 1
+                )
+            ) AS dupes
+        FROM {dataset_name}
+        """
+    ).fetchone()
+
+    failures = []
+    if total == 0:
+        failures.append("dataset is empty")
+    if null_ids > 0:
+        failures.append(f"{null_ids} rows with NULL order_id")
+    if null_customers > 0:
+        failures.append(f"{null_customers} rows with NULL customer_id")
+    if negative_totals > 0:
+        failures.append(f"{negative_totals} rows with negative order_total")
+    if dupes > 0:
+        failures.append(f"{dupes} duplicated order_id values")
+
+    if failures:
+        return False, "; ".join(failures)
+    return True, f"{total} orders passed all checks"